@@ -2,7 +2,8 @@
 """Convert markdown files to styled PDFs.
 
 Usage:
-    md2pdf [input.md] [output.pdf] [--style resume|doc|notes]
+    md2pdf [input.md] [-o output.pdf] [--style resume|doc|notes]
+    md2pdf a.md b.md ... [--style resume|doc|notes]   (built in parallel)
 
 Styles:
     resume  — LaTeX Sourabh Bajaj template (via tectonic)
@@ -11,11 +12,50 @@ Styles:
 """
 
 import argparse
+import functools
+import hashlib
+import importlib.util
+import multiprocessing
+import os
 import re
+import shutil
 import subprocess
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-import markdown
-import weasyprint
+
+# ── Build cache ──────────────────────────────────────────────────────────────
+
+def _stamp_path(out_path):
+    return out_path.with_suffix('.md2pdf.stamp')
+
+
+@functools.lru_cache(maxsize=None)
+def _script_hash():
+    # Fragments, escaping and the parser live in this file, not just the templates
+    return hashlib.blake2b(Path(__file__).read_bytes(), digest_size=16).hexdigest()
+
+
+def source_stamp(md_bytes, style, template):
+    """Stamp identifying a build: source hash, style name, template and script hashes."""
+    md_hash = hashlib.blake2b(md_bytes, digest_size=16).hexdigest()
+    tpl_hash = hashlib.blake2b(template.encode(), digest_size=16).hexdigest()
+    return f"{md_hash} {style} {tpl_hash} {_script_hash()}\n"
+
+
+def is_up_to_date(md_path, out_path, stamp):
+    """True if out_path was built from this exact source/style and is newer than md_path."""
+    try:
+        return (_stamp_path(out_path).read_text() == stamp
+                and out_path.stat().st_mtime > md_path.stat().st_mtime)
+    except OSError:
+        return False
+
+
+def write_stamp(out_path, stamp):
+    _stamp_path(out_path).write_text(stamp)
+
 
 # ── LaTeX resume template (Sourabh Bajaj style) ─────────────────────────────
 
@@ -71,31 +111,84 @@ LATEX_PREAMBLE = r"""\documentclass[letterpaper,11pt]{article}
 \begin{document}
 """
 
-
+# Static LaTeX body fragments emitted by build_resume_tex, one line each.
+_NAME_TAB_OPEN = rb'\begin{tabular*}{\textwidth}{l@{\extracolsep{\fill}}r}' b'\n'
+_NAME_TAB_CLOSE = rb'\end{tabular*}' b'\n' rb'\vspace{2mm}' b'\n'
+_SUBHEAD_LIST_START = rb'  \resumeSubHeadingListStart' b'\n'
+_SUBHEAD_LIST_END = rb'  \resumeSubHeadingListEnd' b'\n'
+_ITEM_LIST_START = rb'    \resumeItemListStart' b'\n'
+_ITEM_LIST_END = rb'    \resumeItemListEnd' b'\n'
+_TAB_OPEN = (rb'    \vspace{-1pt}\item' b'\n'
+             rb'      \begin{tabular*}{0.97\textwidth}{l@{\extracolsep{\fill}}r}' b'\n')
+_TAB_CLOSE = rb'      \end{tabular*}\vspace{2pt}' b'\n'
+_H4_VSPACE = rb'    \vspace{-8pt}' b'\n'
+_DOC_END = rb'\end{document}' b'\n'
+# \resumeSubheading{company}{loc}\n  {role}{dates}, joined around its 4 fields
+_RSH_OPEN = '    \\resumeSubheading{'
+_RSH_SEP = '}{'
+_RSH_ROW2 = '}\n      {'
+_RSH_CLOSE = '}\n'
+
+# Inline markdown, line-kind and meta-line patterns, compiled once at import.
+_BOLD_RE = re.compile(r'\*\*(.+?)\*\*')
+_ITAL_RE = re.compile(r'\*(.+?)\*')
+_LINK_RE = re.compile(r'\[(.+?)\]\((.+?)\)')
+# One token per non-blank line, tagged by lastgroup. Headings need a non-#
+# char after the marker and, like bullets, something besides whitespace.
+_LINE_RE = re.compile(r'''
+    ^[^\S\n]*(?:
+        \#\ (?=.*\S)(?P<h1>[^#\n].*)
+      | \#\#\ (?=.*\S)(?P<h2>[^#\n].*)
+      | \#\#\#\ (?=.*\S)(?P<h3>[^#\n].*)
+      | \#\#\#\#\ (?=.*\S)(?P<h4>[^#\n].*)
+      | -\ (?=.*\S)(?P<bullet>.*)
+      | (?P<text>\S.*)
+    )''', re.MULTILINE | re.VERBOSE)
+_META_RE = re.compile(r'\*\*(.+?)\*\*(?:\s*\|\s*\*(.+?)\*)?')
+_FLAT_BOLD_RE = re.compile(r'\\textbf\{(.+?):\}?\s*(.*)')
+
+# LaTeX special chars and typographic symbols, expanded in a single pass.
+# Applies to every escape_tex'd field (name, sections, company/role, ####
+# headers, meta), not just fmt'd lines.
+_TEX_TBL = str.maketrans({
+    '&': r'\&',
+    '%': r'\%',
+    '#': r'\#',
+    '_': r'\_',
+    '\u2192': r'$\rightarrow$',
+    '\u2013': '--',
+    '\u201c': '``',
+    '\u201d': "''",
+})
+# Any char _TEX_TBL rewrites; lets plain strings skip translate entirely
+_TEX_SPECIAL_RE = re.compile('[' + re.escape(''.join(map(chr, _TEX_TBL))) + ']')
+
+
+@functools.lru_cache(maxsize=2048)
 def escape_tex(t):
-    """Escape LaTeX special chars, preserving markdown formatting markers."""
-    t = t.replace('&', r'\&')
-    t = t.replace('%', r'\%')
-    t = t.replace('#', r'\#')
-    t = t.replace('_', r'\_')
-    return t
+    """Escape LaTeX special chars and symbols, preserving markdown formatting markers."""
+    if _TEX_SPECIAL_RE.search(t) is None:
+        return t
+    return t.translate(_TEX_TBL)
 
 
+@functools.lru_cache(maxsize=2048)
 def fmt(t):
     """Convert markdown inline to LaTeX: bold, italic, links, symbols."""
     t = escape_tex(t)
-    t = re.sub(r'\*\*(.+?)\*\*', r'\\textbf{\1}', t)
-    t = re.sub(r'\*(.+?)\*', r'\\textit{\1}', t)
-    t = re.sub(r'\[(.+?)\]\((.+?)\)', r'\\href{\2}{\1}', t)
-    t = t.replace('→', r'$\rightarrow$')
-    t = t.replace('–', '--')
-    t = t.replace('\u201c', '``').replace('\u201d', "''")
+    # Plain text (most dates, locations, bullets) never enters the regex engine
+    if '*' in t:
+        t = _BOLD_RE.sub(r'\\textbf{\1}', t)
+        # Bold-only text (the common case) has no markers left for italics
+        if '*' in t:
+            t = _ITAL_RE.sub(r'\\textit{\1}', t)
+    if '](' in t:
+        t = _LINK_RE.sub(r'\\href{\2}{\1}', t)
     return t
 
 
-def parse_heading3(line):
-    """Parse ### line into (name_or_company, role_or_empty)."""
-    text = line.lstrip('#').strip()
+def parse_heading3(text):
+    """Parse ### heading text into (name_or_company, role_or_empty)."""
     for sep in [' — ', ' -- ', ' \\textemdash ', u'\u2014']:
         if sep in text:
             a, b = text.split(sep, 1)
@@ -108,7 +201,7 @@ def parse_meta(line):
     raw = line.strip()
     # Extract bold portion and any trailing | *italic*
     extra = ''
-    m = re.match(r'\*\*(.+?)\*\*(?:\s*\|\s*\*(.+?)\*)?', raw)
+    m = _META_RE.match(raw)
     if not m:
         return '', '', ''
     bold_part = m.group(1).strip()
@@ -120,154 +213,171 @@ def parse_meta(line):
     return '', bold_part.strip(), extra
 
 
+# Section kind flags, resolved once per ## heading
+SECTION_EDU = 1   # subheadings show the school and degree/dates only
+SECTION_FLAT = 2  # bullets sit directly in the subheading list, no item list
+
+
+def section_kind(title):
+    """Classify a lowercased ## title into SECTION_* flags."""
+    kind = SECTION_EDU if 'education' in title else 0
+    if 'skill' in title or 'co-curricular' in title:
+        kind |= SECTION_FLAT
+    return kind
+
+
 def build_resume_tex(md_text):
-    """Convert resume markdown to LaTeX string using Sourabh Bajaj template."""
-    lines = md_text.strip().split('\n')
-    out = [LATEX_PREAMBLE]
+    """Convert resume markdown to LaTeX bytes using Sourabh Bajaj template."""
+    buf = bytearray(LATEX_PREAMBLE.encode())
+    buf += b'\n'
+    emit = buf.extend
     item_list_open = False
     sub_list_open = False
-    current_section = ''
+    section = 0
 
     def close_items():
         nonlocal item_list_open
         if item_list_open:
-            out.append(r'    \resumeItemListEnd')
+            emit(_ITEM_LIST_END)
             item_list_open = False
 
     def close_sublist():
         nonlocal sub_list_open
         close_items()
         if sub_list_open:
-            out.append(r'  \resumeSubHeadingListEnd')
+            emit(_SUBHEAD_LIST_END)
             sub_list_open = False
 
+    def item_bullet(text):
+        nonlocal item_list_open
+        if not item_list_open:
+            emit(_ITEM_LIST_START)
+            item_list_open = True
+        emit(f'      \\item\\small{{{text}}}\n'.encode())
+
+    def flat_bullet(text):
+        m = _FLAT_BOLD_RE.match(text)
+        if m:
+            emit(f'    \\item[$\\circ$]\\small{{\\textbf{{{m.group(1)}}}{{: {m.group(2)}}}}}\\vspace{{-5pt}}\n'.encode())
+        else:
+            emit(f'    \\item[$\\circ$]\\small{{{text}}}\\vspace{{-5pt}}\n'.encode())
+
+    bullet_handlers = (item_bullet, flat_bullet)
+    emit_bullet = item_bullet
+
+    tokens = list(_LINE_RE.finditer(md_text))
+    n = len(tokens)
     i = 0
-    while i < len(lines):
-        L = lines[i].strip()
-
-        # Skip blanks and ---
-        if not L or L.startswith('---'):
-            i += 1
-            continue
+    while i < n:
+        tok = tokens[i]
+        kind = tok.lastgroup
+        L = tok[kind].strip()
+        i += 1
 
         # ── H1: Name ──
-        if re.match(r'^# [^#]', L):
-            name = escape_tex(L[2:].strip())
+        if kind == 'h1':
+            name = escape_tex(L)
+            # Contact is the next non-blank line, whatever it holds
+            contact = fmt(tokens[i][0].strip()) if i < n else ''
+            emit(_NAME_TAB_OPEN)
+            emit(f'  \\textbf{{\\Large {name}}} & \\\\\n  {contact}\n'.encode())
+            emit(_NAME_TAB_CLOSE)
             i += 1
-            # Find contact line
-            while i < len(lines) and not lines[i].strip():
-                i += 1
-            contact = fmt(lines[i].strip()) if i < len(lines) else ''
-            out.append(r'\begin{tabular*}{\textwidth}{l@{\extracolsep{\fill}}r}')
-            out.append(f'  \\textbf{{\\Large {name}}} & \\\\')
-            out.append(f'  {contact}')
-            out.append(r'\end{tabular*}')
-            out.append(r'\vspace{2mm}')
-            i += 1
-            continue
 
         # ── H2: Section ──
-        if re.match(r'^## [^#]', L):
+        elif kind == 'h2':
             close_sublist()
-            current_section = L[3:].strip().lower()
-            out.append(f'\\section{{{escape_tex(L[3:].strip())}}}')
-            out.append(r'  \resumeSubHeadingListStart')
+            section = section_kind(L.lower())
+            emit_bullet = bullet_handlers[bool(section & SECTION_FLAT)]
+            emit(f'\\section{{{escape_tex(L)}}}\n'.encode())
+            emit(_SUBHEAD_LIST_START)
             sub_list_open = True
-            i += 1
-            continue
 
         # ── H3: Subheading ──
-        if re.match(r'^### [^#]', L):
+        elif kind == 'h3':
             close_items()
             company, role = parse_heading3(L)
             company = escape_tex(company)
             role = escape_tex(role)
-            # Peek for meta line
-            j = i + 1
-            while j < len(lines) and not lines[j].strip():
-                j += 1
+            # Meta line, if any, is the next non-blank line
             loc = dates = extra = ''
-            if j < len(lines) and lines[j].strip().startswith('**'):
-                loc, dates, extra = parse_meta(lines[j])
-                loc = loc.replace('–', '--')
-                dates = dates.replace('–', '--')
+            if i < n and tokens[i].lastgroup == 'text' and tokens[i]['text'].startswith('**'):
+                loc, dates, extra = parse_meta(tokens[i]['text'])
                 if extra:
                     role = (role + ' | ' + extra) if role else extra
-                i = j + 1
-            else:
                 i += 1
             # Peek: if next content is ####, need extra space after subheading
-            peek = i
-            while peek < len(lines) and not lines[peek].strip():
-                peek += 1
-            has_h4 = peek < len(lines) and lines[peek].strip().startswith('####')
+            has_h4 = i < n and (tokens[i].lastgroup == 'h4' or tokens[i][0].lstrip().startswith('####'))
 
-            if 'education' in current_section:
+            if section & SECTION_EDU:
                 uni = dates or loc
-                out.append(f'    \\resumeSubheading{{{company}}}{{}}')
-                out.append(f'      {{{escape_tex(uni)}}}{{}}')
+                emit((_RSH_OPEN + company + _RSH_SEP + _RSH_ROW2
+                      + escape_tex(uni) + _RSH_SEP + _RSH_CLOSE).encode())
             elif has_h4:
                 # Inline subheading without -5pt so #### header doesn't collide
-                out.append(r'    \vspace{-1pt}\item')
-                out.append(r'      \begin{tabular*}{0.97\textwidth}{l@{\extracolsep{\fill}}r}')
-                out.append(f'        \\textbf{{{company}}} & {escape_tex(loc)} \\\\')
-                out.append(f'        \\textit{{\\small {role}}} & \\textit{{\\small {escape_tex(dates)}}} \\\\')
-                out.append(r'      \end{tabular*}\vspace{2pt}')
+                emit(_TAB_OPEN)
+                emit(f'        \\textbf{{{company}}} & {escape_tex(loc)} \\\\\n'
+                     f'        \\textit{{\\small {role}}} & \\textit{{\\small {escape_tex(dates)}}} \\\\\n'.encode())
+                emit(_TAB_CLOSE)
             else:
-                out.append(f'    \\resumeSubheading{{{company}}}{{{escape_tex(loc)}}}')
-                out.append(f'      {{{role}}}{{{escape_tex(dates)}}}')
-            continue
+                emit((_RSH_OPEN + company + _RSH_SEP + escape_tex(loc) + _RSH_ROW2
+                      + role + _RSH_SEP + escape_tex(dates) + _RSH_CLOSE).encode())
 
         # ── H4: Sub-section italic header ──
-        if re.match(r'^#### [^#]', L):
+        elif kind == 'h4':
             close_items()
-            header = escape_tex(L[5:].strip())
-            out.append(f'    {{\\small {header}}}')
-            out.append(r'    \vspace{-8pt}')
-            i += 1
-            continue
+            header = escape_tex(L)
+            emit(f'    {{\\small {header}}}\n'.encode())
+            emit(_H4_VSPACE)
 
         # ── Bullet ──
-        if L.startswith('- '):
-            text = fmt(L[2:].strip())
-            is_flat = 'skill' in current_section or 'co-curricular' in current_section
-
-            if is_flat:
-                # Flat sections: items go directly in SubHeadingList, no ItemList
-                m = re.match(r'\\textbf\{(.+?):\}?\s*(.*)', text)
-                if m:
-                    out.append(f'    \\item[$\\circ$]\\small{{\\textbf{{{m.group(1)}}}{{: {m.group(2)}}}}}\\vspace{{-5pt}}')
-                else:
-                    out.append(f'    \\item[$\\circ$]\\small{{{text}}}\\vspace{{-5pt}}')
-            else:
-                if not item_list_open:
-                    out.append(r'    \resumeItemListStart')
-                    item_list_open = True
-                out.append(f'      \\item\\small{{{text}}}')
-            i += 1
-            continue
+        elif kind == 'bullet':
+            emit_bullet(fmt(L))
 
-        # Fallback: skip
-        i += 1
+        # Anything else (---, plain text): skip
 
     close_sublist()
-    out.append(r'\end{document}')
-    return '\n'.join(out)
+    emit(_DOC_END)
+    return bytes(buf)
 
 
-def build_resume_pdf(md_path, out_path):
-    """Convert resume markdown to Sourabh Bajaj LaTeX template and compile."""
-    tex = build_resume_tex(md_path.read_text())
-    tex_path = out_path.with_suffix('.tex')
-    tex_path.write_text(tex)
-
-    r = subprocess.run(["tectonic", str(tex_path)], capture_output=True, text=True)
-    if r.returncode != 0:
-        print(f"LaTeX error:\n{r.stderr}")
-        # Show the .tex for debugging
-        print(f"Generated .tex at: {tex_path}")
+@functools.lru_cache(maxsize=None)
+def tectonic_path():
+    """Absolute path to tectonic, so each spawn execs it directly without a PATH walk."""
+    path = shutil.which("tectonic")
+    if path is None:
+        print("tectonic not found on PATH (brew install tectonic)")
         raise SystemExit(1)
-    print(f"OK {tex_path}")
+    return path
+
+
+def build_resume_pdf(md_path, out_path, force=False):
+    """Convert resume markdown to Sourabh Bajaj LaTeX template and compile."""
+    md_bytes = md_path.read_bytes()
+    stamp = source_stamp(md_bytes, "resume", LATEX_PREAMBLE)
+    if not force and is_up_to_date(md_path, out_path, stamp):
+        return
+    tex = build_resume_tex(md_bytes.decode('utf-8', errors='replace'))
+
+    # Feed the .tex on stdin; tectonic names the result texput.pdf, so give
+    # each build its own outdir next to out_path and move it into place.
+    with tempfile.TemporaryDirectory(dir=out_path.parent) as outdir:
+        # No preexec_fn/start_new_session/user switching, so on Linux with
+        # Python 3.10+ subprocess can use vfork instead of a full fork. macOS
+        # always forks here.
+        r = subprocess.run([tectonic_path(), "-o", outdir, "--outfmt", "pdf", "-"],
+                           input=tex, capture_output=True)
+        if r.returncode != 0:
+            print(f"LaTeX error:\n{r.stderr.decode(errors='replace')}")
+            # Keep the .tex for debugging
+            tex_path = out_path.with_suffix('.tex')
+            tex_path.write_bytes(tex)
+            print(f"Generated .tex at: {tex_path}")
+            raise SystemExit(1)
+        os.replace(Path(outdir) / "texput.pdf", out_path)
+    # Drop a debug .tex left by an earlier failed build
+    out_path.with_suffix('.tex').unlink(missing_ok=True)
+    write_stamp(out_path, stamp)
 
 
 # ── CSS for doc/notes ────────────────────────────────────────────────────────
@@ -312,6 +422,12 @@ table { font-size: 10.5pt; margin: 10pt 0; } th, td { padding: 5pt 10pt; }
 """,
 }
 
+HTML_PRE = "<!DOCTYPE html><html><head><meta charset='utf-8'></head><body>"
+HTML_POST = "</body></html>"
+
+# weasyprint.CSS per style, parsed on first use and reused across builds
+_COMPILED_CSS = {}
+
 
 def guess_style(f):
     n = f.lower()
@@ -320,42 +436,132 @@ def guess_style(f):
 
 def preprocess_md(text):
     """Fix common markdown issues that trip up the parser."""
-    lines = text.split('\n')
     result = []
-    for i, line in enumerate(lines):
+    prev = ''  # previous line, stripped once
+    for line in text.split('\n'):
+        cur = line.strip()
         # Insert blank line before table headers (line starts with | and has |---|)
-        if line.strip().startswith('|') and i > 0 and result and result[-1].strip() and not result[-1].strip().startswith('|'):
+        if cur.startswith('|') and prev and not prev.startswith('|'):
             result.append('')
         result.append(line)
+        prev = cur
     return '\n'.join(result)
 
 
-def build_html_pdf(md_path, out_path, style):
-    md_text = preprocess_md(md_path.read_text())
-    html_body = markdown.markdown(md_text, extensions=["tables", "smarty", "fenced_code"])
-    html = f"<!DOCTYPE html><html><head><meta charset='utf-8'></head><body>{html_body}</body></html>"
-    weasyprint.HTML(string=html).write_pdf(str(out_path), stylesheets=[weasyprint.CSS(string=STYLES[style])])
+def compiled_css(style):
+    """Parsed weasyprint stylesheet for a style, built once per process."""
+    css = _COMPILED_CSS.get(style)
+    if css is None:
+        import weasyprint
+        css = _COMPILED_CSS[style] = weasyprint.CSS(string=STYLES[style])
+    return css
+
+
+@functools.lru_cache(maxsize=None)
+def md_renderer_name():
+    """Which markdown library md_renderer() uses, found without importing it."""
+    return "markdown-it-py" if importlib.util.find_spec("markdown_it") else "markdown"
+
+
+@functools.lru_cache(maxsize=None)
+def md_renderer():
+    """Markdown -> HTML callable: markdown-it-py if installed, else Python-Markdown."""
+    if md_renderer_name() == "markdown":
+        import markdown
+        return functools.partial(markdown.markdown, extensions=["tables", "smarty", "fenced_code"])
+    from markdown_it import MarkdownIt
+    md = MarkdownIt("commonmark", {"html": True, "typographer": True})
+    return md.enable(["table", "strikethrough", "replacements", "smartquotes"]).render
+
+
+def build_html_pdf(md_path, out_path, style, force=False):
+    md_bytes = md_path.read_bytes()
+    # The two renderers' HTML differs, so switching libraries must rebuild
+    stamp = source_stamp(md_bytes, style, md_renderer_name() + "\n" + STYLES[style])
+    if not force and is_up_to_date(md_path, out_path, stamp):
+        return
+    md_text = preprocess_md(md_bytes.decode('utf-8', errors='replace'))
+    # Imported lazily: slow to load and unused by the resume path
+    import weasyprint
+
+    html_body = md_renderer()(md_text)
+    html = HTML_PRE + html_body + HTML_POST
+    weasyprint.HTML(string=html).write_pdf(str(out_path), stylesheets=[compiled_css(style)])
+    write_stamp(out_path, stamp)
+
+
+def build(md_path, out_path, style, force=False):
+    """Build one PDF in the given style and report its size."""
+    if style == "resume":
+        build_resume_pdf(md_path, out_path, force)
+    else:
+        build_html_pdf(md_path, out_path, style, force)
+
+    print(f"OK {out_path} ({out_path.stat().st_size // 1024}KB) [{style}]")
+
+
+def build_all(jobs, force=False):
+    """Build (md_path, out_path, style) jobs, in parallel when there are several."""
+    if len(jobs) == 1:
+        build(*jobs[0], force)
+        return
+    # CPython documents fork as unsafe on macOS, so only non-darwin POSIX gets
+    # it; elsewhere workers spawn and load what they need lazily.
+    ctx = None
+    if os.name == "posix" and sys.platform != "darwin":
+        ctx = multiprocessing.get_context("fork")
+        html_styles = {style for _, _, style in jobs if style != "resume"}
+        if html_styles:
+            # Import and parse CSS once here so forked workers inherit them.
+            # The parent is still single-threaded at this point (the pool has
+            # not started), so forking after loading weasyprint is safe.
+            md_renderer()
+            for style in html_styles:
+                compiled_css(style)
+    workers = min(len(jobs), os.cpu_count() or 1)
+    failed = False
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+        futures = [pool.submit(build, *job, force) for job in jobs]
+        for fut in futures:
+            try:
+                fut.result()
+            except SystemExit:
+                failed = True
+    if failed:
+        raise SystemExit(1)
 
 
 def main():
     parser = argparse.ArgumentParser(description="Convert markdown to styled PDF")
-    parser.add_argument("input", nargs="?", help="Input markdown file")
-    parser.add_argument("output", nargs="?", help="Output PDF file")
+    parser.add_argument("input", nargs="*", help="Input markdown file(s)")
+    parser.add_argument("--output", "-o", help="Output PDF file (single input only)")
     parser.add_argument("--style", "-s", choices=["resume", "doc", "notes"],
                         help="Style preset (default: auto-detect from filename)")
+    parser.add_argument("--force", action="store_true",
+                        help="Rebuild even if the cached PDF is up to date")
     args = parser.parse_args()
 
     personal = Path(__file__).parent.parent / "personal"
-    md_path = Path(args.input) if args.input else personal / "resume.md"
-    out_path = Path(args.output) if args.output else md_path.with_suffix(".pdf")
-    style = args.style or guess_style(md_path.name)
-
-    if style == "resume":
-        build_resume_pdf(md_path, out_path)
-    else:
-        build_html_pdf(md_path, out_path, style)
-
-    print(f"OK {out_path} ({out_path.stat().st_size // 1024}KB) [{style}]")
+    paths = [Path(p) for p in args.input] or [personal / "resume.md"]
+    if args.output and len(paths) > 1:
+        parser.error("--output needs exactly one input file")
+    if len(paths) == 2 and paths[1].suffix.lower() == ".pdf":
+        parser.error(f"{paths[1]}: output paths are now given with -o/--output, "
+                     f"e.g. md2pdf {paths[0]} -o {paths[1]}")
+    if len(paths) > 1:
+        for md_path in paths:
+            if md_path.suffix.lower() != ".md":
+                parser.error(f"{md_path}: batch inputs must be .md files")
+    jobs = [(md_path, Path(args.output) if args.output else md_path.with_suffix(".pdf"))
+            for md_path in paths]
+    for md_path, out_path in jobs:
+        if not md_path.is_file():
+            parser.error(f"{md_path}: no such file")
+        if out_path.resolve() == md_path.resolve():
+            parser.error(f"{md_path}: output would overwrite the input")
+
+    build_all([(md_path, out_path, args.style or guess_style(md_path.name))
+               for md_path, out_path in jobs], args.force)
 
 
 if __name__ == "__main__":